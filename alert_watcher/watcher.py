@@ -1,10 +1,56 @@
 #!/usr/bin/env python3
 import os
+import sys
+import mmap
+import stat
+import json
+import logging
 import time
-import re
-from collections import deque
-from slack_sdk.webhook import WebhookClient
-from datetime import datetime
+import queue
+import threading
+import regex
+from array import array
+import requests
+from requests.adapters import HTTPAdapter
+
+try:
+    from inotify_simple import INotify, flags as inotify_flags
+except ImportError:  # Not on Linux or package missing - poll instead
+    INotify = None
+
+logger = logging.getLogger(__name__)
+
+# Pool names are compared by identity on every log line
+POOL_BLUE = sys.intern('blue')
+POOL_GREEN = sys.intern('green')
+
+# Full log pattern used when LOG_STRICT_PARSE is on, compiled once per process.
+# Only pool (group 1) and upstream_status (group 2) are captured; the other
+# fields are just validated.
+# Possessive quantifiers never backtrack, so malformed lines fail fast.
+LOG_PATTERN = regex.compile(
+    rb'\[[^\]]++\] \S++ "[^"]*+" \d++ '
+    rb'pool="([^"]*+)" '
+    rb'release="[^"]*+" '
+    rb'upstream_status=(\d++|-) '
+    rb'upstream_addr=\S++ '
+    rb'request_time=[\d.]++ '
+    rb'upstream_response_time=[\d.-]++',
+    flags=regex.V1
+)
+
+# Bytes per os.read() of the access log
+READ_CHUNK = 65536
+
+# Shorter lines can't hold every field of the extended log format
+MIN_LOG_LINE = 80
+
+# A rotated log is followed once the new file has data, or after this long with no writes
+ROTATE_IDLE_SEC = 30
+
+# Slack posts are retried with doubling backoff before an alert is given up
+SLACK_ATTEMPTS = 4
+SLACK_BACKOFF_SEC = 1
 
 class LogWatcher:
     def __init__(self):
@@ -14,50 +60,105 @@ class LogWatcher:
         self.window_size = int(os.getenv('WINDOW_SIZE', 200))
         self.cooldown_sec = int(os.getenv('ALERT_COOLDOWN_SEC', 300))
         self.maintenance_mode = os.getenv('MAINTENANCE_MODE', 'false').lower() == 'true'
+        self.strict_parse = os.getenv('LOG_STRICT_PARSE', 'false').lower() == 'true'
         
         # Alert state tracking
-        self.request_window = deque(maxlen=self.window_size)
+        # Ring of 1 per 5xx, 0 otherwise - ring_head is the next slot to overwrite
+        self.error_ring = array('b', bytes(self.window_size))
+        self.ring_head = 0
+        self.ring_full = False
+        self.error_count = 0
         self.last_alert_time = {}
-        self.current_pool = os.getenv('INITIAL_ACTIVE_POOL', 'blue')
+        self.current_pool = sys.intern(os.getenv('INITIAL_ACTIVE_POOL', 'blue'))
         self.last_seen_pool = self.current_pool
         self.initial_pool = self.current_pool  # Track original pool for recovery
         self.error_alert_sent = False
         self.failover_occurred = False
+        self._ts_cache = (0, '')  # (epoch second, formatted timestamp)
+        
+        # Hand-off between the reader, parser and Slack sender threads.
+        # line_queue holds batches of up to READ_CHUNK bytes, so 64 caps it near 4 MiB.
+        self.line_queue = queue.Queue(maxsize=64)
+        self.alert_queue = queue.Queue(maxsize=64)
+        self.dropped_alerts = 0
         
         # Initialize Slack client
         if self.slack_webhook:
-            self.slack_client = WebhookClient(self.slack_webhook)
+            # Keep-alive session so alerts reuse one connection to Slack
+            self.slack_client = requests.Session()
+            self.slack_client.mount('https://', HTTPAdapter(pool_connections=1, pool_maxsize=4))
+            self.slack_client.headers['Content-Type'] = 'application/json'
             print("✅ Slack client initialized")
         else:
             self.slack_client = None
             print("❌ SLACK_WEBHOOK_URL not set")
         
-        # Log parsing pattern - captures all required fields
-        self.log_pattern = re.compile(
-            r'\[(?P<timestamp>[^\]]+)\] (?P<remote_addr>\S+) "(?P<request>[^"]*)" (?P<status>\d+) '
-            r'pool="(?P<pool>[^"]*)" '
-            r'release="(?P<release>[^"]*)" '
-            r'upstream_status=(?P<upstream_status>\d+|-) '
-            r'upstream_addr=(?P<upstream_addr>\S+) '
-            r'request_time=(?P<request_time>[\d.]+) '
-            r'upstream_response_time=(?P<upstream_response_time>[\d.-]+)'
-        )
+        # Webhook payload serialized once - alerts only splice in their text
+        self.payload_template = json.dumps({
+            'text': '{MSG}',
+            'blocks': [{'type': 'section', 'text': {'type': 'mrkdwn', 'text': '{MSG}'}}],
+        })
+    
+    def _pool_name(self, raw_pool):
+        """Map a raw pool slice onto the interned pool constants"""
+        if raw_pool == b'blue':
+            return POOL_BLUE
+        if raw_pool == b'green':
+            return POOL_GREEN
+        return None
+    
+    def _fast_parse(self, line):
+        """Slice pool and the first upstream_status byte out of a raw line without the regex"""
+        i = line.find(b' pool="')
+        if i < 0:
+            return None
+        end = line.find(b'"', i + 7)
+        j = line.find(b' upstream_status=', i)
+        if end < 0 or j < 0:
+            return None
+        pool = self._pool_name(line[i + 7:end])
+        
+        # Only the leading digit matters, so read it straight off the buffer
+        # ('-' means no upstream was tried and stays out of the error window)
+        k = j + 17
+        status_byte = line[k] if k < len(line) and 0x30 <= line[k] <= 0x39 else None
+        return pool, status_byte
     
     def parse_log_line(self, line):
-        """Parse log line to extract all required fields"""
-        match = self.log_pattern.match(line)
+        """Parse raw log line into a (pool, status_byte) tuple"""
+        if not self.strict_parse:
+            return self._fast_parse(line)
+        
+        # Cheap rejects for blanks and foreign lines before touching the regex
+        if len(line) < MIN_LOG_LINE or b'upstream_status=' not in line or b'pool="' not in line:
+            return None
+        
+        # Strict mode validates every field, rejecting lines the fast path would slice
+        match = LOG_PATTERN.match(line, concurrent=True)
         if match:
-            return match.groupdict()
+            raw_pool, upstream_status = match.group(1, 2)
+            status_byte = None if upstream_status == b'-' else upstream_status[0]
+            return self._pool_name(raw_pool), status_byte
         return None
     
     def calculate_error_rate(self):
         """Calculate 5xx error rate over sliding window"""
-        if len(self.request_window) == 0:
+        window_len = self.window_length()
+        if window_len == 0:
             return 0.0
         
-        error_count = sum(1 for req in self.request_window 
-                         if req.get('upstream_status', '').startswith('5'))
-        return (error_count / len(self.request_window)) * 100
+        return 100.0 * self.error_count / window_len
+    
+    def window_length(self):
+        """Number of requests currently in the sliding window"""
+        return self.window_size if self.ring_full else self.ring_head
+    
+    def _now_str(self):
+        """Alert timestamp, formatted at most once per second"""
+        now = int(time.time())
+        if now != self._ts_cache[0]:
+            self._ts_cache = (now, time.strftime('%Y-%m-%d %H:%M:%S UTC', time.gmtime(now)))
+        return self._ts_cache[1]
     
     def should_alert(self, alert_type):
         """Enforce alert cooldowns to prevent spam"""
@@ -65,10 +166,10 @@ class LogWatcher:
         last_time = self.last_alert_time.get(alert_type, 0)
         return (now - last_time) >= self.cooldown_sec
     
-    def send_slack_alert(self, message, alert_type):
-        """Post alert to Slack webhook"""
+    def send_slack_alert(self, build_message, alert_type):
+        """Queue alert for the Slack sender thread, formatting it only if it will be sent"""
         if self.maintenance_mode:
-            print(f"🔧 MAINTENANCE: Suppressed {alert_type}")
+            logger.info("🔧 MAINTENANCE: Suppressed %s", alert_type)
             return False
             
         if not self.slack_client:
@@ -76,31 +177,52 @@ class LogWatcher:
             return False
             
         if not self.should_alert(alert_type):
-            print(f"⏰ Cooldown active for {alert_type}")
+            logger.info("⏰ Cooldown active for %s", alert_type)
             return False
         
         try:
-            response = self.slack_client.send(text=message)
-            if response.status_code == 200:
-                self.last_alert_time[alert_type] = time.time()
-                print(f"✅ {alert_type.upper()} sent to Slack")
-                return True
-            else:
-                print(f"❌ Slack error: {response.body}")
-                return False
-        except Exception as e:
-            print(f"💥 Slack send failed: {e}")
+            self.alert_queue.put_nowait((build_message(), alert_type))
+        except queue.Full:
+            self.dropped_alerts += 1
+            print(f"❌ Alert queue full, dropped {alert_type} ({self.dropped_alerts} dropped so far)")
             return False
+        
+        # Start the cooldown on enqueue so a burst can't queue duplicates
+        self.last_alert_time[alert_type] = time.time()
+        return True
+    
+    def deliver_alerts(self):
+        """Post queued alerts to the Slack webhook, retrying failed sends"""
+        while True:
+            message, alert_type = self.alert_queue.get()
+            payload = self.payload_template.replace('{MSG}', json.dumps(message)[1:-1]).encode()
+            
+            # Alert state was committed on enqueue, so a failed post must be retried here
+            for attempt in range(1, SLACK_ATTEMPTS + 1):
+                try:
+                    response = self.slack_client.post(self.slack_webhook, data=payload, timeout=5)
+                    if response.status_code == 200:
+                        print(f"✅ {alert_type.upper()} sent to Slack")
+                        break
+                    print(f"❌ Slack error ({attempt}/{SLACK_ATTEMPTS}): {response.text}")
+                except Exception as e:
+                    print(f"💥 Slack send failed ({attempt}/{SLACK_ATTEMPTS}): {e}")
+                
+                if attempt < SLACK_ATTEMPTS:
+                    time.sleep(SLACK_BACKOFF_SEC * 2 ** (attempt - 1))
+            else:
+                print(f"❌ Gave up on {alert_type} after {SLACK_ATTEMPTS} attempts")
     
     def detect_failover(self, pool):
         """Detect Blue→Green or Green→Blue failover"""
-        if pool and pool != self.last_seen_pool:
+        if pool is not None and pool is not self.last_seen_pool:
             print(f"🔄 FAILOVER: {self.last_seen_pool.upper()} → {pool.upper()}")
             
-            message = (f"⚠️ *Failover Detected*\n"
-                      f"Traffic switched from {self.last_seen_pool.upper()} to {pool.upper()} pool\n"
-                      f"• Time: {datetime.now().strftime('%Y-%m-%d %H:%M:%S UTC')}\n"
-                      f"• Action: Check health of {self.last_seen_pool.upper()} container")
+            def message():
+                return (f"⚠️ *Failover Detected*\n"
+                       f"Traffic switched from {self.last_seen_pool.upper()} to {pool.upper()} pool\n"
+                       f"• Time: {self._now_str()}\n"
+                       f"• Action: Check health of {self.last_seen_pool.upper()} container")
             
             if self.send_slack_alert(message, 'failover'):
                 self.last_seen_pool = pool
@@ -109,81 +231,195 @@ class LogWatcher:
     def detect_service_recovery(self, pool):
         """Detect when service returns to primary pool"""
         if (self.failover_occurred and 
-            pool == self.initial_pool and 
-            pool != self.last_seen_pool):
+            pool is self.initial_pool and 
+            pool is not self.last_seen_pool):
             
             print(f"🟢 SERVICE RECOVERY: Back to {pool.upper()} pool")
             
-            message = (f"✅ *Service Recovery*\n"
-                      f"Primary {pool.upper()} pool is serving traffic again\n"
-                      f"• Recovery Time: {datetime.now().strftime('%Y-%m-%d %H:%M:%S UTC')}\n"
-                      f"• Status: Primary pool restored and healthy")
+            def message():
+                return (f"✅ *Service Recovery*\n"
+                       f"Primary {pool.upper()} pool is serving traffic again\n"
+                       f"• Recovery Time: {self._now_str()}\n"
+                       f"• Status: Primary pool restored and healthy")
             
             if self.send_slack_alert(message, 'recovery'):
                 self.failover_occurred = False
     
-    def monitor_error_rate(self, log_data):
+    def record_errors(self, error_flags):
+        """Merge a batch of 0/1 error flags into the sliding window"""
+        size = self.window_size
+        if len(error_flags) > size:
+            error_flags = error_flags[-size:]
+        
+        # Write the batch in at most two contiguous slices around the ring end
+        ring = self.error_ring
+        head = self.ring_head
+        first = min(len(error_flags), size - head)
+        self.error_count += sum(error_flags[:first]) - sum(ring[head:head + first])
+        ring[head:head + first] = error_flags[:first]
+        head += first
+        
+        rest = len(error_flags) - first
+        if head == size:
+            self.error_count += sum(error_flags[first:]) - sum(ring[:rest])
+            ring[:rest] = error_flags[first:]
+            head = rest
+            self.ring_full = True
+        
+        self.ring_head = head
+    
+    def monitor_error_rate(self, error_flags):
         """Monitor >2% 5xx error rate over last 200 requests"""
-        if log_data.get('upstream_status'):
-            self.request_window.append(log_data)
+        self.record_errors(error_flags)
+        
+        current_size = self.window_length()
+        error_rate = self.calculate_error_rate()
+        error_count = self.error_count
+        
+        # Show progress for debugging
+        if current_size % 25 == 0:
+            logger.debug("📈 Error Rate: %.1f%% (%d/%d)", error_rate, error_count, current_size)
+        
+        # Check threshold with minimum samples to avoid false positives
+        if current_size >= 50 and error_rate > self.error_threshold and not self.error_alert_sent:
+            print(f"🚨 HIGH ERROR RATE: {error_rate:.1f}% > {self.error_threshold}%")
             
-            current_size = len(self.request_window)
-            error_rate = self.calculate_error_rate()
-            error_count = sum(1 for req in self.request_window 
-                             if req.get('upstream_status', '').startswith('5'))
+            def message():
+                return (f"🚨 *High Error Rate Detected*\n"
+                       f"Upstream 5xx errors exceed {self.error_threshold}% threshold\n"
+                       f"• Current Rate: {error_rate:.1f}%\n"
+                       f"• Errors: {error_count}/{current_size} requests\n"
+                       f"• Window: Last {self.window_size} requests\n"
+                       f"• Pool: {self.current_pool.upper()}\n"
+                       f"• Time: {self._now_str()}\n"
+                       f"• Action: Inspect upstream logs, consider pool toggle")
             
-            # Show progress for debugging
-            if current_size % 25 == 0:
-                print(f"📈 Error Rate: {error_rate:.1f}% ({error_count}/{current_size})")
+            if self.send_slack_alert(message, 'error_rate'):
+                self.error_alert_sent = True
+        
+        # Reset when errors drop and send recovery alert
+        elif error_rate <= 1.0 and self.error_alert_sent:  # Use 1% as recovery threshold
+            print("📉 Error rate returned to normal levels")
+            def recovery_message():
+                return (f"🟢 *Error Rate Recovery*\n"
+                       f"5xx error rate returned to normal: {error_rate:.1f}%\n"
+                       f"• Recovery Time: {self._now_str()}\n"
+                       f"• Status: Error rate stabilized")
+            self.send_slack_alert(recovery_message, 'error_recovery')
+            self.error_alert_sent = False
+    
+    def update_pool(self, pool):
+        """Track the serving pool and detect failovers/recovery"""
+        old_pool = self.current_pool
+        self.current_pool = pool
+        
+        # Detect failover to backup pool
+        if pool is not old_pool:
+            self.detect_failover(pool)
+        
+        # Detect recovery back to primary pool
+        self.detect_service_recovery(pool)
+    
+    def process_batch(self, lines):
+        """Process a chunk of nginx log lines with one pool check per chunk"""
+        pool = None
+        error_flags = array('b')
+        
+        for line in lines:
+            log_data = self.parse_log_line(line.strip())
+            if not log_data:
+                continue
             
-            # Check threshold with minimum samples to avoid false positives
-            if current_size >= 50 and error_rate > self.error_threshold and not self.error_alert_sent:
-                print(f"🚨 HIGH ERROR RATE: {error_rate:.1f}% > {self.error_threshold}%")
-                
-                message = (f"🚨 *High Error Rate Detected*\n"
-                          f"Upstream 5xx errors exceed {self.error_threshold}% threshold\n"
-                          f"• Current Rate: {error_rate:.1f}%\n"
-                          f"• Errors: {error_count}/{current_size} requests\n"
-                          f"• Window: Last {self.window_size} requests\n"
-                          f"• Pool: {self.current_pool.upper()}\n"
-                          f"• Time: {datetime.now().isoformat()}\n"
-                          f"• Action: Inspect upstream logs, consider pool toggle")
+            line_pool, status_byte = log_data
+            if line_pool:
+                pool = line_pool
+            if status_byte is not None:
+                error_flags.append(status_byte == 0x35)  # b'5'
+        
+        # Only the last pool in the chunk decides failover/recovery
+        if pool:
+            self.update_pool(pool)
+        
+        # Monitor error rates at least once per window so a spike early in a big chunk is still seen
+        size = self.window_size
+        for start in range(0, len(error_flags), size):
+            self.monitor_error_rate(error_flags[start:start + size])
+    
+    def process_lines(self):
+        """Parse batches of lines handed over by the reader"""
+        while True:
+            lines = self.line_queue.get()
+            try:
+                self.process_batch(lines)
+            except Exception as e:
+                print(f"❌ Processing error: {e}")
+    
+    def open_inotify(self, log_file):
+        """Watch log file for writes and logrotate, or return None to fall back to polling"""
+        if INotify is None:
+            return None
+        
+        try:
+            inotify = INotify()
+            # IN_DELETE_SELF waits for our own fd to close, so an unlink shows up as IN_ATTRIB
+            inotify.add_watch(log_file, inotify_flags.MODIFY | inotify_flags.ATTRIB
+                              | inotify_flags.MOVE_SELF | inotify_flags.DELETE_SELF)
+            return inotify
+        except OSError as e:
+            print(f"⚠️ inotify unavailable, polling instead: {e}")
+            return None
+    
+    def open_log(self, log_file):
+        """Wait for the log file, then open it along with its inotify watch"""
+        while True:
+            if os.path.exists(log_file):
+                fd = os.open(log_file, os.O_RDONLY | os.O_NONBLOCK)
+                if stat.S_ISREG(os.fstat(fd).st_mode):
+                    return fd, self.open_inotify(log_file)
                 
-                if self.send_slack_alert(message, 'error_rate'):
-                    self.error_alert_sent = True
+                # nginx's image links access.log to /dev/stdout until the entrypoint replaces it
+                os.close(fd)
             
-            # Reset when errors drop and send recovery alert
-            elif error_rate <= 1.0 and self.error_alert_sent:  # Use 1% as recovery threshold
-                print("📉 Error rate returned to normal levels")
-                recovery_message = (f"🟢 *Error Rate Recovery*\n"
-                                  f"5xx error rate returned to normal: {error_rate:.1f}%\n"
-                                  f"• Recovery Time: {datetime.now().isoformat()}\n"
-                                  f"• Status: Error rate stabilized")
-                self.send_slack_alert(recovery_message, 'error_recovery')
-                self.error_alert_sent = False
-    
-    def process_log_line(self, line):
-        """Process each nginx log line"""
-        log_data = self.parse_log_line(line)
-        if not log_data:
+            print("⏳ Waiting for nginx logs...")
+            time.sleep(2)
+    
+    def drain_log(self, fd, pending):
+        """Queue every complete line readable from fd, returning the new partial line and whether anything was read"""
+        read_any = False
+        while True:
+            chunk = os.read(fd, READ_CHUNK)
+            if not chunk:
+                return pending, read_any
+            read_any = True
+            *new_lines, pending = (pending + chunk).split(b'\n')
+            if new_lines:
+                self.line_queue.put(new_lines)
+    
+    def replay_backlog(self, fd):
+        """Queue the complete lines already in the log straight from an mmap"""
+        size = os.fstat(fd).st_size
+        if size == 0:
             return
         
-        pool = log_data.get('pool')
-        
-        # Update pool and detect failovers/recovery
-        if pool:
-            old_pool = self.current_pool
-            self.current_pool = pool
-            
-            # Detect failover to backup pool
-            if pool != old_pool:
-                self.detect_failover(pool)
-            
-            # Detect recovery back to primary pool
-            self.detect_service_recovery(pool)
+        with mmap.mmap(fd, size, access=mmap.ACCESS_READ) as mm:
+            last_nl = mm.rfind(b'\n')
+            pos = released = 0
+            while pos <= last_nl:
+                # Batch roughly READ_CHUNK bytes of whole lines at a time
+                end = mm.rfind(b'\n', pos, min(pos + READ_CHUNK, last_nl + 1))
+                if end < 0:
+                    end = mm.find(b'\n', pos)
+                self.line_queue.put(mm[pos:end].split(b'\n'))
+                pos = end + 1
+                
+                # Unmap pages already split so a big log isn't kept resident
+                done = pos - pos % mmap.PAGESIZE
+                if done > released:
+                    mm.madvise(mmap.MADV_DONTNEED, released, done - released)
+                    released = done
         
-        # Monitor error rates
-        self.monitor_error_rate(log_data)
+        # Live tail picks up from the first unterminated byte
+        os.lseek(fd, last_nl + 1, os.SEEK_SET)
     
     def watch_logs(self):
         """Tail nginx logs in real time"""
@@ -192,33 +428,72 @@ class LogWatcher:
         print(f"📁 Monitoring: {log_file}")
         print("🎯 Detecting: Failovers, High Error Rates, Service Recovery")
         
-        # Wait for log file
-        while not os.path.exists(log_file):
-            print("⏳ Waiting for nginx logs...")
-            time.sleep(2)
+        # Parsing and Slack delivery run off the reader thread
+        threading.Thread(target=self.process_lines, daemon=True).start()
+        threading.Thread(target=self.deliver_alerts, daemon=True).start()
+        
+        fd, inotify = self.open_log(log_file)
+        self.replay_backlog(fd)
         
-        # Track file position
-        last_size = 0
+        # Partially written last line, completed by the next read
+        pending = b''
+        rotated = False
+        last_write = time.monotonic()
         
         while True:
             try:
-                current_size = os.path.getsize(log_file)
+                # Hand off each chunk as it's read so a backlog never sits in memory whole
+                pending, read_any = self.drain_log(fd, pending)
+                if read_any:
+                    last_write = time.monotonic()
+                
+                # Log was truncated - start again from the top, reading what's there
+                # now since its IN_MODIFY events are already used up
+                if not read_any and os.fstat(fd).st_size < os.lseek(fd, 0, os.SEEK_CUR):
+                    os.lseek(fd, 0, os.SEEK_SET)
+                    pending = b''
+                    continue
+                
+                # nginx keeps writing the rotated file until it reopens its log, so
+                # only follow the new one once it has data or the old one goes quiet
+                if (rotated and os.path.exists(log_file)
+                        and (os.stat(log_file).st_size > 0
+                             or time.monotonic() - last_write >= ROTATE_IDLE_SEC)):
+                    new_fd, new_inotify = self.open_log(log_file)
+                    self.drain_log(fd, pending)
+                    os.close(fd)
+                    if inotify:
+                        inotify.close()
+                    fd, inotify = new_fd, new_inotify
+                    pending = b''
+                    rotated = False
+                    continue
                 
-                if current_size > last_size:
-                    with open(log_file, 'r') as f:
-                        f.seek(last_size)
-                        new_lines = f.readlines()
-                        last_size = current_size
-                    
-                    for line in new_lines:
-                        self.process_log_line(line.strip())
+                # Block until nginx writes more, or poll without inotify.
+                # After a rotation, wake every second to look for the new file.
+                was_rotated = rotated
+                if inotify:
+                    mask = 0
+                    for event in inotify.read(timeout=1000 if rotated else None):
+                        mask |= event.mask
+                    rotated = bool(rotated
+                                   or mask & (inotify_flags.MOVE_SELF | inotify_flags.DELETE_SELF)
+                                   or (mask & inotify_flags.ATTRIB and os.fstat(fd).st_nlink == 0))
+                else:
+                    time.sleep(0.5)
+                    rotated = (not os.path.exists(log_file)
+                               or os.stat(log_file).st_ino != os.fstat(fd).st_ino)
                 
-                time.sleep(0.5)
+                # Idle time on the old file counts from the rotation, not its last write
+                if rotated and not was_rotated:
+                    last_write = time.monotonic()
                 
             except Exception as e:
                 print(f"❌ Log error: {e}")
                 time.sleep(2)
 
 if __name__ == '__main__':
+    # Same stream as the print() output so the container log stays in order
+    logging.basicConfig(stream=sys.stdout, level=os.getenv('LOG_LEVEL', 'INFO').upper(), format='%(message)s')
     watcher = LogWatcher()
     watcher.watch_logs()
\ No newline at end of file